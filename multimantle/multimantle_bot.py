@@ -10,7 +10,7 @@ from numpy import True_
 
 logging.basicConfig(level = logging.DEBUG)
 
-from multimantle_game import MultimantleGame, MultimantleGameSimul, MultimantleGameType, NoWordFoundError, semantle
+from multimantle_game import MultimantleGame, MultimantleGameSimul, MultimantleGameType, MultimantleScorer, NoWordFoundError, semantle
 
 from wordle_track_bot import WordleTrack
 
@@ -47,6 +47,14 @@ class Multimantle(commands.Cog):
         self.bot = bot
         # Map channel id to game
         self.games : Dict[int, MultimantleGame] = {}
+        # Map day to the scorer shared by that day's daily games
+        self.daily_scorers : Dict[int, MultimantleScorer] = {}
+
+    def getDailyScorer(self):
+        secret, day = getSemantleSecret()
+        if not day in self.daily_scorers:
+            self.daily_scorers = {day: MultimantleScorer(secret)}
+        return self.daily_scorers[day], day
 
     @commands.command()
     async def hello(self, ctx, *, member: discord.Member = None):
@@ -141,12 +149,36 @@ class Multimantle(commands.Cog):
             game_type = MultimantleGameType[game_type]
         else:
             game_type = MultimantleGameType.CHAOS
-        secret, day = getSemantleSecret()
+        scorer, day = self.getDailyScorer()
         game = MultimantleGame()
-        game.start(secret, game_type)
+        game.start(game_type=game_type, scorer=scorer)
         self.games[ctx.channel.id] = game
         await ctx.send(f"Starting Semantle Game #{day}! Spoiler Warning!!!")
 
+    @commands.command()
+    async def semantle_daily_global(self, ctx, n: str = '5'):
+        """Show the top n guesses for the daily semantle across all channels"""
+        _, day = getSemantleSecret()
+        if not day in self.daily_scorers:
+            await ctx.send(f"No guesses yet for Semantle Game #{day}")
+            return
+
+        try:
+            n = int(n)
+            if n <=0:
+                raise ValueError()
+        except Exception as e:
+            await ctx.send(f"Invalid n: {n}")
+            return
+
+        results = self.daily_scorers[day].status(n)
+        if len(results) == 0:
+            await ctx.send(f"No guesses yet for Semantle Game #{day}")
+            return
+        # Spoiler each line, other channels may have already found the secret
+        msg = "\n".join([f"||{fmtGuessResult(r)}||" for r in results])
+        await ctx.send(f"Semantle Game #{day} global:\n{msg}")
+
     @commands.command()
     async def test_status(self, ctx):
         """Show game debug info"""
@@ -147,6 +147,57 @@ class MultimantleGameType(Enum):
     SIMUL=auto()
     TURNS=auto()
 
+class MultimantleScorer:
+    """Scoring state for one secret, shareable between games
+
+    Each word is looked up and scored once. Every word scored through
+    this scorer is also kept in a global leaderboard.
+    """
+
+    def __init__(self, secret):
+        self.secret = secret
+        self.secret_data = {"vec":semantle.word(self.secret)}
+        logging.info(self.secret_data)
+        # Map word to (similarity, percentile)
+        self.scores = {}
+        # Words not found in the model
+        self.misses = set()
+        self.nearby_results = []
+        self.guess_results = []
+
+    def __repr__(self):
+        return f'{self.__class__.__name__} "{self.secret}": {len(self.scores)} words'
+
+    def score(self, guess):
+        if guess in self.scores:
+            return self.scores[guess]
+        if guess in self.misses:
+            raise NoWordFoundError(guess)
+
+        try:
+            guess_data = semantle.model2(self.secret, guess)
+        except NoWordFoundError as nwfe:
+            self.misses.add(guess)
+            raise nwfe
+        guess_vec = guess_data["vec"]
+        percentile = guess_data["percentile"] if "percentile" in guess_data else None
+        similarity = getCosSim(guess_vec, self.secret_data["vec"]) * 100.0
+
+        score = (similarity, percentile)
+        self.scores[guess] = score
+        self.guess_results.append([similarity, guess, percentile, len(self.guess_results)+1])
+        self.guess_results.sort(key=(lambda a:a[0]), reverse=True)
+        return score
+
+    def status(self, n):
+        n = min(n,len(self.guess_results))
+        return self.guess_results[0:n]
+
+    def nearby(self, n):
+        if n > len(self.nearby_results):
+            self.nearby_results = semantle.nearby(self.secret, n) or []
+        return self.nearby_results[0:n]
+
 class MultimantleGame:
 
     def __init__(self):
@@ -155,6 +206,7 @@ class MultimantleGame:
         self.players = set()
         self.secret = None
         self.secret_data = None
+        self.scorer = None
         self.game_type = None
         self.guess_list = []
         self.guess_results = []
@@ -166,14 +218,18 @@ class MultimantleGame:
     def join(self, player_id):
         self.players.add(player_id)
 
-    def start(self, secret=None, game_type=MultimantleGameType.CHAOS):
-        if secret == None:
+    def start(self, secret=None, game_type=MultimantleGameType.CHAOS, scorer=None):
+        if scorer is not None:
+            self.secret = scorer.secret
+        elif secret == None:
             self.secret = genRandSecret()
         else:
             self.secret = secret
 
-        self.secret_data = {"vec":semantle.word(self.secret)}
-        logging.info(self.secret_data)
+        if scorer is None:
+            scorer = MultimantleScorer(self.secret)
+        self.scorer = scorer
+        self.secret_data = scorer.secret_data
         self.game_type = game_type
 
         self.started = True
@@ -181,13 +237,7 @@ class MultimantleGame:
     def guess(self, guess, player_id = None):
         logging.debug(f"Game guess: {guess}")
         guess = guess.lower()
-        try:
-            guess_data = semantle.model2(self.secret, guess)
-        except NoWordFoundError as nwfe:
-            raise nwfe
-        guess_vec = guess_data["vec"]
-        percentile = guess_data["percentile"] if "percentile" in guess_data else None
-        similarity = getCosSim(guess_vec, self.secret_data["vec"]) * 100.0
+        similarity, percentile = self.scorer.score(guess)
         if not guess in self.guess_list:
             self.guess_list.append(guess)
             guess_result = [similarity, guess, percentile, len(self.guess_list)]
@@ -204,8 +254,7 @@ class MultimantleGame:
         return self.guess_results[0:n]
 
     def nearby(self, n):
-        results = semantle.nearby(self.secret, n)
-        return results
+        return self.scorer.nearby(n)
 
 class MultimantleGameSimul(MultimantleGame):
 
@@ -4,8 +4,10 @@ from discord.ext import commands
 import sqlite3
 
 import datetime
+import re
+from itertools import islice
 from dateutil import parser as dateutil_parser
-from typing import Dict
+from typing import Dict, Iterable, Iterator, Optional, Tuple
 import logging
 logging.basicConfig(level = logging.DEBUG)
 
@@ -13,10 +15,16 @@ WORDLE_TRACK_DB_FNAME = "../../wordle/wordle_track.db"
 
 wordle_start = datetime.datetime(year=2021, month=6, day=19)
 
+# Failed games (X/6) are stored with this score
+FAIL_SCORE = 7
+
+IMPORT_CHUNK_SIZE = 1000
+
 def getDate(date: datetime.datetime = None):
     if not date:
         date = datetime.datetime.now()
     return (date - wordle_start).days
+
 # Tables:
 # Results:
 # [date id] name score word1 word2 word3 word4 word5 word6
@@ -28,10 +36,13 @@ def getDate(date: datetime.datetime = None):
 def formatEntry(entry):
     words = [e for e in entry[4:] if not e == None]
     wordstr = "\n".join(words)
-    return f"Game #{entry[1]} ({entry[2]})\nScore: {entry[3]}\n{wordstr}"
+    return f"Game #{entry[1]} ({entry[2]})\nScore: {formatScoreValue(entry[3])}\n{wordstr}"
 
 def formatScore(entry):
-    return f"{entry[2]}: {entry[3]}"
+    return f"{entry[2]}: {formatScoreValue(entry[3])}"
+
+def formatScoreValue(score):
+    return "X" if score == FAIL_SCORE else score
 
 def formatScoreDisplay(member, scores):
     if len(scores) == 0:
@@ -46,7 +57,7 @@ def formatScoreDisplay(member, scores):
     4: {scores.count(4)}
     5: {scores.count(5)}
     6: {scores.count(6)}
-    X: {"Cannot count failures yet"}
+    X: {scores.count(FAIL_SCORE)}
     Average: {avg}"""
 
 def getAvg(scores):
@@ -58,6 +69,111 @@ def getAvg(scores):
 def formatAvg(member, avg):
     return f"{member.name} avg: {avg}"
 
+# "Wordle 1,234 3/6" or "Wordle 245 X/6*"
+SHARE_HEADER_RE = re.compile(r"Wordle\s+#?(\d{1,3}(?:,\d{3})+|\d+)\s+([1-6Xx])/6\*?")
+
+def parseScore(score: str) -> Optional[int]:
+    score = score.strip().upper()
+    if score.endswith("/6"):
+        score = score[:-2]
+    if score == "X":
+        return FAIL_SCORE
+    if score.isdigit() and 1 <= int(score) <= 6:
+        return int(score)
+    return None
+
+def validGameDate(date: int) -> bool:
+    return 0 <= date <= getDate()
+
+def parseGameDate(date: str) -> Optional[int]:
+    """Accepts a game number or an ISO 8601 date"""
+    date = date.strip().lstrip("#")
+    if date.isdigit():
+        date = int(date)
+    else:
+        try:
+            date = getDate(dateutil_parser.isoparse(date).replace(tzinfo=None))
+        except (ValueError, OverflowError):
+            return None
+    return date if validGameDate(date) else None
+
+def parseWords(words: list, score: int) -> Optional[list]:
+    """Words must be 5 letters, one per guess, or left out entirely"""
+    words = [w.lower() for w in words if w]
+    if len(words) == 0:
+        return words
+    if any([len(w) != 5 or not w.isalpha() for w in words]):
+        return None
+    if len(words) != min(score, 6):
+        return None
+    return words
+
+def parseHistory(lines: Iterable[str]) -> Iterator[Tuple[int, int, list]]:
+    """Lazily parse pasted share grids and exported history lines
+
+    Yields (date, score, words) for each result found. Understands
+    share headers ("Wordle 245 3/6") and comma separated export lines
+    ("date,score[,word1,...,word6]", date as a game number or ISO date).
+    Grid squares and anything unrecognized or invalid are skipped.
+    """
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+
+        match = SHARE_HEADER_RE.search(line)
+        if match:
+            date = int(match.group(1).replace(",", ""))
+            if validGameDate(date):
+                yield date, parseScore(match.group(2)), []
+            continue
+
+        fields = [f.strip() for f in line.split(",")]
+        if len(fields) < 2:
+            continue
+        date = parseGameDate(fields[0])
+        score = parseScore(fields[1])
+        if date is None or score is None:
+            continue
+        words = parseWords(fields[2:], score)
+        if words is None:
+            continue
+        yield date, score, words
+
+def importResults(db_name, user_id, name, results: Iterable[Tuple[int, int, list]],
+        chunk_size=IMPORT_CHUNK_SIZE):
+    """Stream results into the results table, one transaction per chunk
+
+    Existing (id, date) rows are kept, so re-importing is harmless.
+    Returns (imported, skipped) counts, where skipped covers games already
+    recorded as well as repeats within the import.
+    """
+    insert = ("INSERT OR IGNORE INTO results"
+        "(id,date,name,score,word1,word2,word3,word4,word5,word6) "
+        "VALUES (?,?,?,?,?,?,?,?,?,?)")
+
+    rows = ([user_id, date, name, score] + words + [None] * (6 - len(words))
+        for date, score, words in results)
+
+    imported = 0
+    skipped = 0
+    con = sqlite3.connect(db_name)
+    try:
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            before = con.total_changes
+            with con:
+                con.executemany(insert, chunk)
+            changed = con.total_changes - before
+            imported += changed
+            skipped += len(chunk) - changed
+    finally:
+        con.close()
+
+    return imported, skipped
+
     
 
 
@@ -107,6 +223,28 @@ class WordleTrack(commands.Cog):
 
         await ctx.send(formatEntry(entry))
 
+    @commands.command(name="import")
+    async def import_results(self, ctx : commands.Context, *, history: str = ""):
+        """Import past results from pasted share grids or an attached export"""
+        if not isinstance(ctx.channel, discord.DMChannel):
+            await ctx.send("Please import results via DM")
+            return
+
+        lines = history.splitlines()
+        for attachment in ctx.message.attachments:
+            data = await attachment.read()
+            lines += data.decode("utf-8", errors="ignore").splitlines()
+
+        user_id = ctx.channel.recipient.id
+        name = ctx.channel.recipient.name
+        imported, skipped = importResults(self.db_name, user_id, name, parseHistory(lines))
+
+        if imported == 0 and skipped == 0:
+            await ctx.send("No results found to import")
+            return
+
+        await ctx.send(f"Imported {imported} results ({skipped} skipped as duplicates)")
+
     @commands.command()
     async def show(self, ctx : commands.Context, date:str = None):
         """Reveal all scores or games"""